@@ -4,9 +4,17 @@ Action 2: Update Memory
 
 import asyncio
 from typing import Dict, Any, List
-from llm_client import call_llm_safe
+from llm_client import call_llm_safe, json_schema_response_format
 from prompts.update_memory import get_update_memory_prompt, get_update_memory_user_prompt
 from memory import MemoryManager
+from models import MEMORY_UPDATE_RESPONSE_SCHEMA
+from config import LLM_STRUCTURED_OUTPUT
+
+# Constrained decoding replaces the in-prompt examples and JSON skeleton
+_RESPONSE_FORMAT = (
+    json_schema_response_format("memory_update", MEMORY_UPDATE_RESPONSE_SCHEMA)
+    if LLM_STRUCTURED_OUTPUT else None
+)
 
 
 class UpdateMemoryAction:
@@ -25,7 +33,7 @@ class UpdateMemoryAction:
         Returns:
             Update result
         """
-        system_prompt = get_update_memory_prompt()
+        system_prompt = get_update_memory_prompt(structured_output=LLM_STRUCTURED_OUTPUT)
         user_prompt = get_update_memory_user_prompt(
             current_memory=self.memory_manager.get_memory_display(),
             new_text=new_text
@@ -40,7 +48,8 @@ class UpdateMemoryAction:
             system_prompt=system_prompt,
             user_message=user_prompt,
             default=default_result,
-            temperature=0.3
+            temperature=0.3,
+            response_format=_RESPONSE_FORMAT
         )
         
         # Apply updates
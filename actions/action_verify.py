@@ -8,6 +8,9 @@ Includes:
 """
 
 import asyncio
+import re
+from functools import lru_cache
+from hashlib import blake2b
 from typing import Dict, Any, List, Optional, Tuple
 from llm_client import call_llm_safe
 from prompts.verify_proof import (
@@ -16,7 +19,46 @@ from prompts.verify_proof import (
     get_accumulate_attempt_prompt, get_accumulate_attempt_user_prompt
 )
 from memory import MemoryManager
-from config import MAX_VERIFY_ROUNDS, PROOF_CHUNK_SIZE
+from config import MAX_VERIFY_ROUNDS, PROOF_CHUNK_SIZE, MAX_PARALLEL_VERIFY
+from verify_cache import get_verify_cache, make_verify_key
+
+
+@lru_cache(maxsize=256)
+def _split_proof(proof: str, lines_per_segment: int) -> Tuple[Tuple[str, str, bytes], ...]:
+    """
+    Split proof into segments of lines_per_segment lines, cached since each round re-splits the same proofs
+    
+    Each segment carries a digest of the proof up to its last line, the verifier judges a segment
+    against the steps before it, so its verdict is only reusable while those are unchanged
+    """
+    lines = proof.strip().split('\n')
+    segments = []
+    prefix = blake2b(digest_size=16)
+    
+    for i in range(0, len(lines), lines_per_segment):
+        segment_lines = lines[i:i + lines_per_segment]
+        segment_content = '\n'.join(segment_lines)
+        start_line = i + 1
+        end_line = min(i + lines_per_segment, len(lines))
+        segment_info = f"Line {start_line} to Line {end_line}"
+        for line in segment_lines:
+            prefix.update(line.encode('utf-8'))
+            prefix.update(b'\n')
+        segments.append((segment_content, segment_info, prefix.copy().digest()))
+    
+    return tuple(segments)
+
+
+# LaTeX spacing commands (\, \; \: \! \quad \qquad and escaped spaces) and whitespace runs
+_LATEX_SPACING_PATTERN = re.compile(r'\\(?:qquad|quad|[,;:! ])')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def _proof_digest(proof: str) -> bytes:
+    """Digest of a normalized proof, so duplicates that only differ in spacing match (case is significant)"""
+    normalized = _LATEX_SPACING_PATTERN.sub(' ', proof)
+    normalized = _WHITESPACE_PATTERN.sub(' ', normalized).strip()
+    return blake2b(normalized.encode('utf-8'), digest_size=16).digest()
 
 
 class VerifyAndModifyAction:
@@ -26,6 +68,8 @@ class VerifyAndModifyAction:
         self.memory_manager = memory_manager
         self.lines_per_segment = PROOF_CHUNK_SIZE  # Lines per verification segment
         self.max_modify_rounds = MAX_VERIFY_ROUNDS  # Maximum modification rounds
+        # Shared by all verifications of this Agent (parallel verify actions included), bounds in-flight verifier calls
+        self._verify_semaphore = asyncio.Semaphore(MAX_PARALLEL_VERIFY)
     
     async def execute(
         self,
@@ -47,12 +91,19 @@ class VerifyAndModifyAction:
         current_proof = proof
         all_attempts = []  # Record all attempts
         all_errors = []    # Record all error messages
+        failed_proofs = {}  # Normalized proof digest -> verification result of a failed attempt
         
         for round_num in range(self.max_modify_rounds + 1):
-            # Segment-by-segment verification
-            is_valid, verification_result = await self._verify_proof_segments(
-                conjecture_statement, current_proof
-            )
+            # The modifier sometimes returns an attempt that already failed, reuse its verification result
+            proof_key = _proof_digest(current_proof)
+            previous_result = failed_proofs.get(proof_key)
+            if previous_result is not None:
+                is_valid, verification_result = False, previous_result
+            else:
+                # Segment-by-segment verification
+                is_valid, verification_result = await self._verify_proof_segments(
+                    conjecture_statement, current_proof
+                )
             
             if is_valid:
                 # Verification passed, convert conjecture to conclusion
@@ -65,13 +116,15 @@ class VerifyAndModifyAction:
                     "action": "convert_to_lemma"
                 }
             
-            # Record this attempt
-            all_attempts.append({
-                "round": round_num,
-                "proof": current_proof,
-                "errors": verification_result.get("errors", [])
-            })
-            all_errors.extend(verification_result.get("errors", []))
+            # Record this attempt (duplicates are not accumulated again)
+            if previous_result is None:
+                failed_proofs[proof_key] = verification_result
+                all_attempts.append({
+                    "round": round_num,
+                    "proof": current_proof,
+                    "errors": verification_result.get("errors", [])
+                })
+                all_errors.extend(verification_result.get("errors", []))
             
             # If there are more modification opportunities, try to modify
             if round_num < self.max_modify_rounds:
@@ -102,34 +155,35 @@ class VerifyAndModifyAction:
         # Theoretically won't reach here
         return {"verified": False, "error": "Unknown error"}
     
-    def _split_proof_into_segments(self, proof: str) -> List[Tuple[str, str]]:
+    def _split_proof_into_segments(self, proof: str) -> Tuple[Tuple[str, str, bytes], ...]:
         """
         Split proof into segments
         
         Returns:
-            List of (segment_content, segment_info)
+            Tuple of (segment_content, segment_info, proof_prefix_digest)
         """
-        lines = proof.strip().split('\n')
-        segments = []
-        
-        for i in range(0, len(lines), self.lines_per_segment):
-            segment_lines = lines[i:i + self.lines_per_segment]
-            segment_content = '\n'.join(segment_lines)
-            start_line = i + 1
-            end_line = min(i + self.lines_per_segment, len(lines))
-            segment_info = f"Line {start_line} to Line {end_line}"
-            segments.append((segment_content, segment_info))
-        
-        return segments
+        return _split_proof(proof, self.lines_per_segment)
     
     async def _verify_segment(
         self,
         conjecture_statement: str,
         full_proof: str,
         segment_content: str,
-        segment_info: str
+        segment_info: str,
+        proof_prefix_digest: bytes
     ) -> Dict[str, Any]:
-        """Verify a single segment"""
+        """Verify a single segment (verdicts are cached per conjecture, proof up to the segment and Memory state)"""
+        cache = get_verify_cache()
+        cache_key = make_verify_key(
+            conjecture_statement,
+            proof_prefix_digest,
+            segment_content,
+            self.memory_manager.get_version_key()
+        )
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         system_prompt = get_verify_prompt()
         user_prompt = get_verify_user_prompt(
             memory_display=self.memory_manager.get_memory_display(),
@@ -152,6 +206,10 @@ class VerifyAndModifyAction:
             temperature=0.3  # Low temperature for strictness
         )
         
+        # Don't cache the fallback verdict of a failed call
+        if result is not default_result:
+            cache.put(cache_key, result)
+        
         return result
     
     async def _verify_proof_segments(
@@ -169,14 +227,20 @@ class VerifyAndModifyAction:
         all_segment_results = []
         all_errors = []
         
-        for segment_content, segment_info in segments:
-            result = await self._verify_segment(
-                conjecture_statement,
-                proof,
-                segment_content,
-                segment_info
-            )
-            
+        # Segments are verified independently, run them concurrently (bounded for rate limits)
+        async def verify(segment_content: str, segment_info: str, proof_prefix_digest: bytes) -> Dict[str, Any]:
+            async with self._verify_semaphore:
+                return await self._verify_segment(
+                    conjecture_statement,
+                    proof,
+                    segment_content,
+                    segment_info,
+                    proof_prefix_digest
+                )
+        
+        results = await asyncio.gather(*(verify(*segment) for segment in segments))
+        
+        for (segment_content, segment_info, _), result in zip(segments, results):
             all_segment_results.append({
                 "segment_info": segment_info,
                 "result": result
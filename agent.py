@@ -9,7 +9,7 @@ Responsible for:
 """
 
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
 import json
 import os
@@ -62,7 +62,7 @@ class MathExplorerAgent:
         
         self.auto_save = auto_save
         self._is_running = False
-        self._should_stop = False
+        self._stop_event = asyncio.Event()  # Set by request_stop, wakes the run loop at once
         self._event_handlers: Dict[str, List[Callable]] = {}
         self._human_intervention_pending = False
         self._human_response: Optional[str] = None
@@ -78,6 +78,12 @@ class MathExplorerAgent:
             self._event_handlers[event] = []
         self._event_handlers[event].append(handler)
     
+    def off(self, event: str, handler: Callable):
+        """Unregister event handler"""
+        handlers = self._event_handlers.get(event)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+    
     def _emit(self, event: str, data: Any = None):
         """Trigger event"""
         handlers = self._event_handlers.get(event, [])
@@ -450,7 +456,6 @@ class MathExplorerAgent:
             Run result summary
         """
         self._is_running = True
-        self._should_stop = False
         round_num = 0  # Current round number
         
         import logging
@@ -464,7 +469,7 @@ class MathExplorerAgent:
             logger.info(f"[Agent.run] === Round {round_num} starting ===")
             
             # Check if should stop
-            if self._should_stop:
+            if self._stop_event.is_set():
                 self._emit("status", "User requested stop")
                 break
             
@@ -476,7 +481,10 @@ class MathExplorerAgent:
             # Call coordinator to decide this round's actions
             self._emit("status", f"Round {round_num}: Coordinator deciding...")
             logger.info(f"[Agent.run] Round {round_num}: Calling coordinator.decide_next_actions()...")
-            decision = await self.coordinator.decide_next_actions()
+            stopped, decision = await self._run_unless_stopped(self.coordinator.decide_next_actions())
+            if stopped:
+                self._emit("status", "User requested stop")
+                break
             logger.info(f"[Agent.run] Round {round_num}: Coordinator decision received: {list(decision.keys())}")
             
             # Coordinator no longer makes stop decisions, skip stop check
@@ -512,7 +520,14 @@ class MathExplorerAgent:
             # Execute all actions in parallel this round
             self._emit("status", f"Round {round_num}: Executing {len(action_records)} actions in parallel...")
             tasks = [self.execute_action(record) for record in action_records]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            stopped, results = await self._run_unless_stopped(asyncio.gather(*tasks, return_exceptions=True))
+            if stopped:
+                # Actions cancelled mid-flight are recorded as failed
+                for record in action_records:
+                    if record.status == ActionStatus.RUNNING:
+                        self.coordinator.fail_action(record.id, "Stopped by user")
+                self._emit("status", "User requested stop")
+                break
             
             # Summarize this round's results
             success_count = sum(1 for r in results if not isinstance(r, Exception))
@@ -555,6 +570,7 @@ class MathExplorerAgent:
                     self._emit("status", "Continuing exploration...")
         
         self._is_running = False
+        self._stop_event.clear()  # The stop is consumed, the next run starts fresh
         
         # Save final Memory
         filepath = self._save_memory("final")
@@ -604,10 +620,45 @@ class MathExplorerAgent:
     # ==================== Human Intervention ====================
     
     def request_stop(self):
-        """Request to stop Agent"""
-        self._should_stop = True
+        """
+        Request to stop Agent, running actions are cancelled right away
+        
+        Must be called on the Agent's event loop thread (use loop.call_soon_threadsafe from other threads)
+        """
+        self._stop_event.set()
         self._emit("status", "Stopping...")
     
+    def clear_stop_request(self):
+        """
+        Forget a stop requested while no run was active
+        
+        A stop requested before run() starts stops that run, so clear stale requests before scheduling it
+        (on the Agent's event loop thread, like request_stop)
+        """
+        self._stop_event.clear()
+    
+    async def _run_unless_stopped(self, aw) -> Tuple[bool, Any]:
+        """
+        Await aw, cancelling it if a stop is requested first
+        
+        Returns:
+            (stopped, result), result is None when stopped
+        """
+        task = asyncio.ensure_future(aw)
+        stop_waiter = asyncio.ensure_future(self._stop_event.wait())
+        stopped = True
+        try:
+            await asyncio.wait((task, stop_waiter), return_when=asyncio.FIRST_COMPLETED)
+            stopped = not task.done()
+        finally:
+            stop_waiter.cancel()
+            if stopped:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        if stopped:
+            return True, None
+        return False, task.result()
+    
     def _request_human_intervention(self, reason: str):
         """Request human intervention"""
         self._human_intervention_pending = True
@@ -615,8 +666,11 @@ class MathExplorerAgent:
     
     async def _wait_for_human_response(self):
         """Wait for human response"""
-        while self._human_intervention_pending and not self._should_stop:
-            await asyncio.sleep(0.5)
+        while self._human_intervention_pending and not self._stop_event.is_set():
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=0.5)
+            except asyncio.TimeoutError:
+                pass
     
     def provide_human_response(self, response: str):
         """Provide human response"""
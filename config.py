@@ -33,6 +33,8 @@ LLM_TIMEOUT = 600.0          # Timeout in seconds, deep thinking models may need
 LLM_MAX_RETRIES = 3          # Maximum retry count
 LLM_DEFAULT_MAX_TOKENS = 32768  # Default maximum tokens (32K), DeepSeek-V3.2-Thinking limit
 LLM_DEFAULT_TEMPERATURE = 0.7   # Default temperature
+# Enforce the Memory update output with response_format (JSON schema), the API must support it
+LLM_STRUCTURED_OUTPUT = os.getenv('LLM_STRUCTURED_OUTPUT', 'false').lower() == 'true'
 
 # Memory Save Path
 MEMORY_SAVE_PATH = './memory_snapshots/'
@@ -41,6 +43,8 @@ LOG_PATH = './logs/'
 # Verifier Configuration
 MAX_VERIFY_ROUNDS = 3  # Maximum modification rounds
 PROOF_CHUNK_SIZE = 6   # Number of lines per verification segment
+VERIFY_CACHE_SIZE = 4096  # Segment verdicts kept across modification rounds
 
 # Parallel Configuration
 MAX_PARALLEL_ACTIONS = 10
+MAX_PARALLEL_VERIFY = 8   # Maximum concurrent segment verifications across all proofs
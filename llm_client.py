@@ -22,6 +22,19 @@ from config import (
 
 logger = logging.getLogger(__name__)
 
+# orjson encodes request bodies much faster than json (requires: pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, fall back to json
+
+
+def _dump_json_bytes(data: Any) -> bytes:
+    """Serialize data to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
 
 class LLMClient:
     """LLM API Client - Supports deep thinking models"""
@@ -146,7 +159,8 @@ class LLMClient:
         self,
         messages: List[Dict[str, str]],
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> str:
         """Send request to LLM API"""
         if max_tokens is None:
@@ -163,6 +177,10 @@ class LLMClient:
             "temperature": temperature,
             "max_tokens": max_tokens
         }
+        if response_format is not None:
+            payload["response_format"] = response_format
+        # Serialize once, retries resend the same body
+        body = _dump_json_bytes(payload)
         
         async with httpx.AsyncClient(timeout=self.timeout) as client:
             for attempt in range(self.max_retries):
@@ -171,7 +189,7 @@ class LLMClient:
                     response = await client.post(
                         f"{self.base_url}/chat/completions",
                         headers=headers,
-                        json=payload
+                        content=body
                     )
                     response.raise_for_status()
                     result = response.json()
@@ -204,14 +222,15 @@ class LLMClient:
         system_prompt: str,
         user_message: str,
         temperature: float = 0.7,
-        max_tokens: Optional[int] = None
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None
     ) -> str:
         """Single turn conversation"""
         messages = [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_message}
         ]
-        return await self._make_request(messages, temperature, max_tokens)
+        return await self._make_request(messages, temperature, max_tokens, response_format)
     
     async def chat_with_json_output(
         self,
@@ -474,6 +493,14 @@ class LLMClient:
 _client: Optional[LLMClient] = None
 
 
+def json_schema_response_format(name: str, schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an OpenAI-compatible response_format that constrains the output to a JSON schema"""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "schema": schema}
+    }
+
+
 def get_llm_client() -> LLMClient:
     """Get global LLM client"""
     global _client
@@ -512,7 +539,8 @@ async def call_llm_safe(
     user_message: str,
     default: Dict[str, Any] = None,
     temperature: float = LLM_DEFAULT_TEMPERATURE,
-    max_tokens: Optional[int] = None
+    max_tokens: Optional[int] = None,
+    response_format: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Safe LLM call, return default on failure"""
     if default is None:
@@ -520,7 +548,7 @@ async def call_llm_safe(
     
     client = get_llm_client()
     try:
-        response = await client.chat(system_prompt, user_message, temperature, max_tokens)
+        response = await client.chat(system_prompt, user_message, temperature, max_tokens, response_format)
         return client.extract_json_or_default(response, default)
     except Exception as e:
         print(f"[LLM] Call failed: {e}")
@@ -3,16 +3,24 @@ Memory Management Module
 Responsible for Memory CRUD operations and persistent storage
 """
 
+import itertools
 import json
 import os
+import uuid
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from models import (
     Memory, MathObject, MathConcept, ExplorationDirection,
     MathConjecture, MathLemma, ConfidenceLevel
 )
 from config import MEMORY_SAVE_PATH
 
+# Unique id per manager, so version keys of different managers never collide.
+# Manager ids restart at 1 in every process, the process nonce keeps keys of a restarted
+# server (or another worker) from matching ones handed out before
+_PROCESS_NONCE = uuid.uuid4().hex[:8]
+_manager_ids = itertools.count(1)
+
 
 class MemoryManager:
     """Memory Manager"""
@@ -22,6 +30,10 @@ class MemoryManager:
         self.save_path = save_path
         self._ensure_save_dir()
         self._version = 0  # Version number for tracking updates
+        self._uid = next(_manager_ids)
+        self._display_cache: Optional[Tuple[int, str]] = None  # (version, display string)
+        self._dict_cache: Optional[Tuple[int, Dict[str, Any]]] = None  # (version, to_dict result)
+        self._counts_cache: Optional[Tuple[int, Dict[str, int]]] = None  # (version, entity counts)
         
     def _ensure_save_dir(self):
         """Ensure save directory exists"""
@@ -32,8 +44,28 @@ class MemoryManager:
         return self.memory
     
     def get_memory_display(self) -> str:
-        """Get Memory display string (for prompts)"""
-        return self.memory.to_display_string()
+        """Get Memory display string (for prompts), rendered once per version"""
+        if self._display_cache is None or self._display_cache[0] != self._version:
+            self._display_cache = (self._version, self.memory.to_display_string())
+        return self._display_cache[1]
+    
+    def get_memory_dict(self) -> Dict[str, Any]:
+        """Get Memory as a dict, built once per version (shared, do not modify)"""
+        if self._dict_cache is None or self._dict_cache[0] != self._version:
+            self._dict_cache = (self._version, self.memory.to_dict())
+        return self._dict_cache[1]
+    
+    def get_memory_counts(self) -> Dict[str, int]:
+        """Get the number of entities of each type, counted once per version (shared, do not modify)"""
+        if self._counts_cache is None or self._counts_cache[0] != self._version:
+            self._counts_cache = (self._version, {
+                'objects': len(self.memory.objects),
+                'concepts': len(self.memory.concepts),
+                'directions': len(self.memory.directions),
+                'conjectures': len(self.memory.conjectures),
+                'lemmas': len(self.memory.lemmas)
+            })
+        return self._counts_cache[1]
     
     def get_memory_summary(self) -> str:
         """Get Memory summary"""
@@ -406,7 +438,7 @@ class MemoryManager:
         filepath = os.path.join(self.save_path, filename)
         
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.memory.to_dict(), f, ensure_ascii=False, indent=2)
+            json.dump(self.get_memory_dict(), f, ensure_ascii=False, indent=2)
         
         return filepath
     
@@ -416,6 +448,7 @@ class MemoryManager:
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
             self.memory = Memory.from_dict(data)
+            self._version += 1
             return True
         except Exception as e:
             print(f"Failed to load Memory: {e}")
@@ -425,6 +458,10 @@ class MemoryManager:
         """Get current version number"""
         return self._version
     
+    def get_version_key(self) -> str:
+        """Get a key identifying the current Memory state across all managers and processes"""
+        return f"{_PROCESS_NONCE}-{self._uid}-{self._version}"
+    
     def convert_conjecture_to_lemma(self, conj_id: str, proof: str) -> Optional[MathLemma]:
         """Convert conjecture to conclusion (marks conjecture as solved instead of deleting)"""
         conj = self.get_conjecture_by_id(conj_id)
@@ -13,6 +13,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Literal
 from enum import Enum
 import json
+import sys
 from datetime import datetime
 
 
@@ -193,25 +194,26 @@ class Memory:
     _conj_counter: int = 0
     _lem_counter: int = 0
     
+    # Generated ids are interned: they recur in every display, lookup and update
     def get_next_obj_id(self) -> str:
         self._obj_counter += 1
-        return f"obj_{self._obj_counter:03d}"
+        return sys.intern(f"obj_{self._obj_counter:03d}")
     
     def get_next_con_id(self) -> str:
         self._con_counter += 1
-        return f"con_{self._con_counter:03d}"
+        return sys.intern(f"con_{self._con_counter:03d}")
     
     def get_next_dir_id(self) -> str:
         self._dir_counter += 1
-        return f"dir_{self._dir_counter:03d}"
+        return sys.intern(f"dir_{self._dir_counter:03d}")
     
     def get_next_conj_id(self) -> str:
         self._conj_counter += 1
-        return f"conj_{self._conj_counter:03d}"
+        return sys.intern(f"conj_{self._conj_counter:03d}")
     
     def get_next_lem_id(self) -> str:
         self._lem_counter += 1
-        return f"lem_{self._lem_counter:03d}"
+        return sys.intern(f"lem_{self._lem_counter:03d}")
     
     def to_dict(self) -> dict:
         return {
@@ -235,6 +237,9 @@ class Memory:
         memory.directions = [ExplorationDirection.from_dict(dir) for dir in data.get("directions", [])]
         memory.conjectures = [MathConjecture.from_dict(conj) for conj in data.get("conjectures", [])]
         memory.lemmas = [MathLemma.from_dict(lem) for lem in data.get("lemmas", [])]
+        for _, entities in memory._display_sections():
+            for entity in entities:
+                entity.id = sys.intern(entity.id)
         memory._obj_counter = data.get("_obj_counter", len(memory.objects))
         memory._con_counter = data.get("_con_counter", len(memory.concepts))
         memory._dir_counter = data.get("_dir_counter", len(memory.directions))
@@ -242,6 +247,16 @@ class Memory:
         memory._lem_counter = data.get("_lem_counter", len(memory.lemmas))
         return memory
     
+    def _display_sections(self) -> list:
+        """(heading, entities) pairs in display order"""
+        return [
+            ("## I. Mathematical Objects (Objects)", self.objects),
+            ("## II. Mathematical Concepts (Concepts)", self.concepts),
+            ("## III. Exploration Directions (Directions)", self.directions),
+            ("## IV. Mathematical Conjectures (Conjectures)", self.conjectures),
+            ("## V. Conclusions (Lemmas)", self.lemmas),
+        ]
+    
     def to_display_string(self) -> str:
         """Generate complete Memory display string for prompts"""
         sections = []
@@ -250,45 +265,13 @@ class Memory:
         sections.append("【Current Memory Content】")
         sections.append("=" * 60)
         
-        # Mathematical Objects
-        sections.append("\n## I. Mathematical Objects (Objects)")
-        if self.objects:
-            for obj in self.objects:
-                sections.append(obj.to_display_string())
-        else:
-            sections.append("  (None)")
-        
-        # Mathematical Concepts
-        sections.append("\n## II. Mathematical Concepts (Concepts)")
-        if self.concepts:
-            for con in self.concepts:
-                sections.append(con.to_display_string())
-        else:
-            sections.append("  (None)")
-        
-        # Exploration Directions
-        sections.append("\n## III. Exploration Directions (Directions)")
-        if self.directions:
-            for dir in self.directions:
-                sections.append(dir.to_display_string())
-        else:
-            sections.append("  (None)")
-        
-        # Mathematical Conjectures
-        sections.append("\n## IV. Mathematical Conjectures (Conjectures)")
-        if self.conjectures:
-            for conj in self.conjectures:
-                sections.append(conj.to_display_string())
-        else:
-            sections.append("  (None)")
-        
-        # Conclusions
-        sections.append("\n## V. Conclusions (Lemmas)")
-        if self.lemmas:
-            for lem in self.lemmas:
-                sections.append(lem.to_display_string())
-        else:
-            sections.append("  (None)")
+        for heading, entities in self._display_sections():
+            sections.append("\n" + heading)
+            if entities:
+                for entity in entities:
+                    sections.append(entity.to_display_string())
+            else:
+                sections.append("  (None)")
         
         sections.append("\n" + "=" * 60)
         
@@ -367,6 +350,27 @@ MEMORY_UPDATE_OUTPUT_SCHEMA = {
     "required": ["updates", "summary"]
 }
 
+# Response schema for constrained decoding (response_format), matches the update-memory prompt
+MEMORY_UPDATE_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "updates": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "operation": {"type": "string", "enum": ["add", "modify", "mark_solved"]},
+                    "entity_type": {"type": "string", "enum": ["object", "concept", "direction", "conjecture", "lemma"]},
+                    "entity_id": {"type": "string"},
+                    "data": {"type": "object"}
+                },
+                "required": ["operation", "entity_type"]
+            }
+        }
+    },
+    "required": ["updates"]
+}
+
 PARSE_INPUT_OUTPUT_SCHEMA = {
     "type": "object",
     "properties": {
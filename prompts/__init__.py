@@ -2,8 +2,9 @@
 Prompt Module
 """
 
+import importlib
+
 from .parse_input import get_parse_input_prompt, get_parse_input_user_prompt
-from .update_memory import get_update_memory_prompt, get_update_memory_user_prompt
 from .coordinator import get_coordinator_prompt, get_coordinator_user_prompt
 from .retrieval import get_retrieval_prompt, get_retrieval_user_prompt
 from .propose_objects import get_propose_objects_prompt, get_propose_objects_user_prompt
@@ -29,3 +30,22 @@ __all__ = [
     'get_modify_proof_prompt', 'get_modify_proof_user_prompt',
     'get_accumulate_attempt_prompt', 'get_accumulate_attempt_user_prompt'
 ]
+
+
+# Action 2 prompts are imported on first access (PEP 562), processes that never update Memory skip them
+_LAZY_UPDATE_MEMORY_NAMES = (
+    'get_update_memory_prompt', 'get_update_memory_user_prompt'
+)
+
+
+def __getattr__(name):
+    if name == 'update_memory' or name in _LAZY_UPDATE_MEMORY_NAMES:
+        module = importlib.import_module('.update_memory', __name__)
+        for attr in _LAZY_UPDATE_MEMORY_NAMES:
+            globals()[attr] = getattr(module, attr)
+        return module if name == 'update_memory' else globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_UPDATE_MEMORY_NAMES) | {'update_memory'})
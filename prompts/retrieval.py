@@ -6,9 +6,7 @@ Output: Mathematical text in natural language (no specific format required)
 """
 
 
-def get_retrieval_prompt() -> str:
-    """Get the system prompt for retrieving mathematical theories"""
-    return '''You are an experienced mathematician participating in a large-scale mathematical exploration project. You have read all mathematical literature and are proficient in theories from all areas of mathematics.
+_RETRIEVAL_SYSTEM_PROMPT = '''You are an experienced mathematician participating in a large-scale mathematical exploration project. You have read all mathematical literature and are proficient in theories from all areas of mathematics.
 
 ## Project Background
 
@@ -104,6 +102,11 @@ Output should include:
 **Note**: This is natural language output, no JSON format required.'''
 
 
+def get_retrieval_prompt() -> str:
+    """Get the system prompt for retrieving mathematical theories"""
+    return _RETRIEVAL_SYSTEM_PROMPT
+
+
 def get_retrieval_user_prompt(memory_display: str) -> str:
     """
     Get the user prompt for retrieval
@@ -8,9 +8,7 @@ Output:
 """
 
 
-def get_solve_conjecture_prompt() -> str:
-    """Get the system prompt for solving mathematical conjectures"""
-    return '''You are an experienced mathematician participating in a large-scale mathematical exploration project. You are particularly skilled at proving or disproving mathematical conjectures.
+_SOLVE_CONJECTURE_SYSTEM_PROMPT = '''You are an experienced mathematician participating in a large-scale mathematical exploration project. You are particularly skilled at proving or disproving mathematical conjectures.
 
 ## Project Background
 
@@ -165,6 +163,11 @@ Try to use as few new variable names as possible, use known names when possible
 - For example: If there is $n = \\deg(p)$, directly use $\\deg(p)$ instead of introducing a new $n$'''
 
 
+def get_solve_conjecture_prompt() -> str:
+    """Get the system prompt for solving mathematical conjectures"""
+    return _SOLVE_CONJECTURE_SYSTEM_PROMPT
+
+
 def get_solve_conjecture_user_prompt(
     memory_display: str, 
     conjecture_id: str, 
@@ -4,10 +4,12 @@ Action 2: Prompt Template for Updating Memory
 Goal: Organically integrate new mathematical text into the current Memory
 """
 
+import sys
+from functools import lru_cache
 
-def get_update_memory_prompt() -> str:
-    """Get the system prompt for updating Memory"""
-    return '''You are an experienced mathematician participating in a large-scale mathematical exploration project.
+
+# Rules and Memory data type definitions
+_CORE_PROMPT_HEAD = '''You are an experienced mathematician participating in a large-scale mathematical exploration project.
 
 ## Project Background
 
@@ -48,11 +50,7 @@ A mathematical concept is a description of the properties, categories, relations
 **Examples**: Prime number (definition: a positive integer p is called a prime number if and only if the only positive integer divisors of p are 1 and p), Continuity (has different definitions in different spaces, but must be strictly defined before being introduced into Memory in this project), Group (definition...)
 
 **Note**: Both mathematical objects and mathematical concepts can be defined based on existing objects or concepts.
-**Note**: Distinction between mathematical objects and mathematical concepts (Concept is a type/proposition. Object is an Instance)
-  - Mathematical Object: Is a "noun" in the mathematical world, they are the subjects that are operated on, measured, and studied, they often possess a certain "existence" (although abstract). Mathematical objects can be defined based on existing mathematical objects.
-    - Examples: n (type is integer), n^2 (type is integer, depends on existing object $n$), A (type is matrix), f (type is function, need to clearly define domain and codomain. Can define additional properties, such as continuity, formula, etc.)
-  - Mathematical Concept: Is a description of the properties, categories, relationships, or structure of objects (can be a proposition). Can be used to define what an object is, or what relationships exist between objects.
-    - Examples: Prime number (definition: a positive integer p is called a prime number if and only if the only positive integer divisors of p are 1 and p), "Continuity" (definition: a function f from metric space X to Y is called continuous if and only if...), "Group" (definition: a set G and a binary operation X on set G is called a group (G, X) if and only if (satisfies the definition of a group)...)
+**Note**: Distinction between mathematical objects and mathematical concepts (Concept is a type/proposition. Object is an Instance). See the memory_object and memory_concept definitions and examples above.
 
 ### 3. memory_direction (Exploration Direction)
 An exploration direction is a clear direction for exploring conjectures, not necessarily a rigorous mathematical proposition.
@@ -77,7 +75,10 @@ A conclusion is a proven mathematical proposition, or conditions assumed to hold
 - **statement**: Rigorous mathematical proposition (in the form of "prove that"), cannot be a vague exploration direction. Is a mathematical proposition containing some known mathematical objects and concepts
 - **proof**: Complete and rigorous proof (can use known conclusions as lemmas in the proof, but need to note). If it is a condition from the original mathematical text, record as "Conditional assumption"
 
-## Example Reference (Memory Update)
+'''
+
+# Worked examples, only needed until the model has seen them (e.g. cached system prompt)
+_EXAMPLES_APPENDIX = '''## Example Reference (Memory Update)
 
 ### Example 1: Adding Mathematical Objects and Conjectures
 **Current Memory**: Has mathematical objects $p$ (real coefficient polynomial), $q$ (real coefficient polynomial), exploration direction "Explore all possible forms of $p$"
@@ -138,7 +139,10 @@ A conclusion is a proven mathematical proposition, or conditions assumed to hold
   ]
 }
 
-## Update Principles
+'''
+
+# Update principles and output schema
+_CORE_PROMPT_TAIL = '''## Update Principles
 Requirement 1: Ensure Memory is concise and efficient, reduce unnecessary redundancy. But maintain a positive attitude, update all potentially valuable content!
 Requirement 2: You must deeply understand the Memory data type definitions, ensure each update strictly conforms to the Memory data type definitions (especially the completeness and rigor of all entity definitions, dependency relationship completeness (whether the objects/concepts that new entities depend on already exist in Memory, ensure all depended entities must be added or already exist in Memory)).
 
@@ -180,7 +184,10 @@ Use MARK_SOLVED only in the following situations:
 
 ## Output Format
 
-Output JSON directly:
+'''
+
+# JSON shape of the output, unnecessary when the API enforces the response schema
+_OUTPUT_SKELETON = '''Output JSON directly:
 ```json
 {
   "updates": [
@@ -194,7 +201,10 @@ Output JSON directly:
 }
 ```
 
-### Data Field Description for Each entity_type
+'''
+
+# Per-type data fields, the response schema leaves data free-form
+_DATA_FIELDS = '''### Data Field Description for Each entity_type
 
 | entity_type | Required Fields (add operation) | Optional Modification Fields (modify operation) |
 |-------------|---------------------|---------------------------|
@@ -211,26 +221,38 @@ Output JSON directly:
 '''
 
 
-def get_update_memory_user_prompt(current_memory: str, new_text: str) -> str:
+def get_update_memory_prompt(include_examples: bool = True, structured_output: bool = False) -> str:
     """
-    Get the user prompt for updating Memory
+    Get the system prompt for updating Memory
     
-    Input: Mathematical text
-    Output: Specific update instructions for updating Memory based on the text
+    Args:
+        include_examples: Whether to include the example reference section.
+            Pass False once the provider caches the system prompt, or when the output
+            format is enforced otherwise, to save prefill tokens on every call.
+        structured_output: Whether the API enforces MEMORY_UPDATE_RESPONSE_SCHEMA (response_format).
+            Drops the examples and the JSON skeleton, the per-type data fields are kept.
     """
-    return f'''## Current Memory (Project Progress)
-
-{current_memory}
-
----
-
-## New Mathematical Text (New Progress)
-
-{new_text}
-
----
-
-**Update Requirements**:
+    return _build_update_memory_prompt(bool(include_examples) and not structured_output, not structured_output)
+
+
+@lru_cache(maxsize=4)
+def _build_update_memory_prompt(include_examples: bool, include_skeleton: bool) -> str:
+    """Join the prompt fragments on first use, processes that never update Memory keep only the fragments"""
+    parts = [_CORE_PROMPT_HEAD]
+    if include_examples:
+        parts.append(_EXAMPLES_APPENDIX)
+    parts.append(_CORE_PROMPT_TAIL)
+    if include_skeleton:
+        parts.append(_OUTPUT_SKELETON)
+    parts.append(_DATA_FIELDS)
+    return "".join(parts)
+
+
+# Fixed fragments of the user prompt, interned so every build shares one copy
+_USER_PROMPT_MEMORY_HEADING = sys.intern("## Current Memory (Project Progress)\n\n")
+_USER_PROMPT_SEPARATOR = sys.intern("\n\n---\n\n")
+_USER_PROMPT_TEXT_HEADING = sys.intern("## New Mathematical Text (New Progress)\n\n")
+_USER_PROMPT_REQUIREMENTS = sys.intern('''**Update Requirements**:
 1. Analyze the new text, identify mathematical objects, concepts, exploration directions, conjectures, and conclusions within
 2. Compare with current Memory, determine which are new content, which already exist
 3. For existing entities → Consider MODIFY to merge new information
@@ -239,4 +261,21 @@ def get_update_memory_user_prompt(current_memory: str, new_text: str) -> str:
 6. Use LaTeX format for mathematical formulas
 7. Variable naming: Use known names when possible, avoid introducing unnecessary new variables
 
-Please output JSON directly.'''
+Please output JSON directly.''')
+
+
+@lru_cache(maxsize=32)
+def get_update_memory_user_prompt(current_memory: str, new_text: str) -> str:
+    """
+    Get the user prompt for updating Memory
+    
+    Input: Mathematical text
+    Output: Specific update instructions for updating Memory based on the text
+    
+    Cached, since retries and re-verification often resubmit the same (memory, text) pair
+    """
+    return "".join((
+        _USER_PROMPT_MEMORY_HEADING, current_memory,
+        _USER_PROMPT_SEPARATOR, _USER_PROMPT_TEXT_HEADING, new_text,
+        _USER_PROMPT_SEPARATOR, _USER_PROMPT_REQUIREMENTS
+    ))
@@ -5,24 +5,13 @@ Goal: Verify proof correctness, fix errors, accumulate experience
 Includes: Verifier (8.a), Modifier (8.b), Accumulate Attempt (8.c)
 """
 
+# Fragments shared by the user prompts
+_MEMORY_HEADING = "## Current Memory (Project Progress)\n\n"
+_SECTION_BREAK = "\n\n---\n\n"
 
-def get_verify_prompt() -> str:
-    """Get the system prompt for verifying proofs"""
-    return '''You are an experienced mathematical reviewer participating in a large-scale mathematical exploration project. You are particularly skilled at reviewing the rigor and correctness of mathematical proofs.
-
-## Project Background
-
-This is an AI-driven mathematical exploration system. The system maintains a structured Memory to track all progress in mathematical research. In this project, **each proof must be rigorously verified before it can be stored as a correct conclusion in Memory**.
-
-## Your Task
 
-You are the **proof verification expert** for this project — the last line of defense for mathematical rigor. You will be assigned a specific paragraph of a proof (about 6 lines), and your task is to **rigorously verify** whether each step of reasoning in this paragraph is correct.
-
-**Core Principle**: You must apply the **strictest verification standards** to scrutinize every detail in this proof paragraph. Treat each line with suspicion — do not let any potential loopholes, implicit assumptions, or lack of rigor slip through. A proof that "seems correct" is not enough; it must be **unquestionably correct**.
-
-## Memory Data Type Definitions
-
-### 1. memory_object (Mathematical Object)
+# Memory data type definitions shared by the system prompts
+_MEMORY_TYPE_DEFS = '''### 1. memory_object (Mathematical Object)
 A mathematical object is a "noun" in the mathematical world, the subject that is operated on, measured, and studied, possessing a certain "existence" (although abstract). A mathematical object is an **Instance**, which can be defined based on existing mathematical objects.
 - **id**: Identifier (starting from obj_001)
 - **name**: Name (mathematical formula)
@@ -68,7 +57,24 @@ A mathematical conjecture is a rigorous mathematical proposition (in the form of
 A conclusion is a proven mathematical proposition, or conditions assumed to hold in the original mathematical text.
 - **id**: Identifier (starting from lem_001)
 - **statement**: Rigorous mathematical proposition (in the form of "prove that"), cannot be a vague exploration direction. Is a mathematical proposition containing some known mathematical objects and concepts
-- **proof**: Complete and rigorous proof (can use known conclusions as lemmas in the proof, but need to note). If it is a condition from the original mathematical text, record as "Conditional assumption"
+- **proof**: Complete and rigorous proof (can use known conclusions as lemmas in the proof, but need to note). If it is a condition from the original mathematical text, record as "Conditional assumption"'''
+
+
+_VERIFY_SYSTEM_PROMPT = '''You are an experienced mathematical reviewer participating in a large-scale mathematical exploration project. You are particularly skilled at reviewing the rigor and correctness of mathematical proofs.
+
+## Project Background
+
+This is an AI-driven mathematical exploration system. The system maintains a structured Memory to track all progress in mathematical research. In this project, **each proof must be rigorously verified before it can be stored as a correct conclusion in Memory**.
+
+## Your Task
+
+You are the **proof verification expert** for this project — the last line of defense for mathematical rigor. You will be assigned a specific paragraph of a proof (about 6 lines), and your task is to **rigorously verify** whether each step of reasoning in this paragraph is correct.
+
+**Core Principle**: You must apply the **strictest verification standards** to scrutinize every detail in this proof paragraph. Treat each line with suspicion — do not let any potential loopholes, implicit assumptions, or lack of rigor slip through. A proof that "seems correct" is not enough; it must be **unquestionably correct**.
+
+## Memory Data Type Definitions
+
+''' + _MEMORY_TYPE_DEFS + '''
 
 ## Verification Standards
 
@@ -122,46 +128,12 @@ Output JSON directly in the following format:
 - Please verify rigorously, do not miss any suspicious points'''
 
 
-def get_verify_user_prompt(
-    memory_display: str,
-    conjecture_statement: str,
-    full_proof: str,
-    segment_to_verify: str,
-    segment_info: str
-) -> str:
-    """
-    Get the user prompt for verifying a proof paragraph
-    
-    Input: Memory + conjecture proof + paragraph to verify
-    Output: Verification result (JSON)
-    """
-    return f'''## Current Memory (Project Progress)
-
-{memory_display}
-
----
-
-## Conjecture to Prove
-
-{conjecture_statement}
-
----
-
-## Complete Proof (for context reference)
-
-{full_proof}
-
----
-
-## Please verify the following paragraph ({segment_info})
-
-```
-{segment_to_verify}
-```
+def get_verify_prompt() -> str:
+    """Get the system prompt for verifying proofs"""
+    return _VERIFY_SYSTEM_PROMPT
 
----
 
-## Your Task
+_VERIFY_USER_TASK = '''## Your Task
 
 **Rigorously verify** whether the above paragraph is correct.
 
@@ -179,9 +151,29 @@ def get_verify_user_prompt(
 Please output JSON directly.'''
 
 
-def get_modify_proof_prompt() -> str:
-    """Get the system prompt for modifying proofs"""
-    return '''You are an experienced mathematician participating in a large-scale mathematical exploration project. You are particularly skilled at correcting errors in proofs and providing correct proofs.
+def get_verify_user_prompt(
+    memory_display: str,
+    conjecture_statement: str,
+    full_proof: str,
+    segment_to_verify: str,
+    segment_info: str
+) -> str:
+    """
+    Get the user prompt for verifying a proof paragraph
+    
+    Input: Memory + conjecture proof + paragraph to verify
+    Output: Verification result (JSON)
+    """
+    return "".join((
+        _MEMORY_HEADING, memory_display, _SECTION_BREAK,
+        "## Conjecture to Prove\n\n", conjecture_statement, _SECTION_BREAK,
+        "## Complete Proof (for context reference)\n\n", full_proof, _SECTION_BREAK,
+        "## Please verify the following paragraph (", segment_info, ")\n\n```\n", segment_to_verify, "\n```",
+        _SECTION_BREAK, _VERIFY_USER_TASK
+    ))
+
+
+_MODIFY_PROOF_SYSTEM_PROMPT = '''You are an experienced mathematician participating in a large-scale mathematical exploration project. You are particularly skilled at correcting errors in proofs and providing correct proofs.
 
 ## Project Background
 
@@ -196,53 +188,7 @@ You are the **proof correction expert** for this project. Your task is:
 
 ## Memory Data Type Definitions
 
-### 1. memory_object (Mathematical Object)
-A mathematical object is a "noun" in the mathematical world, the subject that is operated on, measured, and studied, possessing a certain "existence" (although abstract). A mathematical object is an **Instance**, which can be defined based on existing mathematical objects.
-- **id**: Identifier (starting from obj_001)
-- **name**: Name (mathematical formula)
-- **type_and_definition**: Type & Definition (complete and clear mathematical definition, can depend on existing mathematical objects and concepts)
-- **comment**: Comment (including the motivation for defining this object and potential exploration directions)
-
-**Examples**: $n$ (type is integer), $n^2$ (type is integer, depends on existing object $n$), $A$ (type is matrix), $f$ (type is function, need to clearly define domain and codomain, can define additional properties like continuity, formula, etc.)
-
-### 2. memory_concept (Mathematical Concept)
-A mathematical concept is a description of the properties, categories, relationships, or structure of objects (can be a proposition). It is used to define what an object is, or what relationships exist between objects. A mathematical concept determines whether a mathematical object satisfies a certain proposition.
-- **id**: Identifier (starting from con_001)
-- **name**: Name (a name that highlights the nature and content of this concept. If it is a consensus concept in the mathematical field, use the standard definition and name.)
-- **definition**: Definition (complete and clear mathematical definition, can depend on existing mathematical concepts. If it is a consensus concept in the mathematical field, use the standard definition and name.)
-- **comment**: Comment (including the motivation for defining this concept and potential exploration directions)
-
-**Examples**: Prime number (definition: a positive integer p is called a prime number if and only if the only positive integer divisors of p are 1 and p), Continuity (has different definitions in different spaces, but must be strictly defined before being introduced into Memory in this project), Group (definition...)
-
-**Note**: Both mathematical objects and mathematical concepts can be defined based on existing objects or concepts.
-**Note**: Distinction between mathematical objects and mathematical concepts (Concept is a type/proposition. Object is an Instance)
-  - Mathematical Object: Is a "noun" in the mathematical world, they are the subjects that are operated on, measured, and studied, they often possess a certain "existence" (although abstract). Mathematical objects can be defined based on existing mathematical objects.
-    - Examples: n (type is integer), n^2 (type is integer, depends on existing object $n$), A (type is matrix), f (type is function, need to clearly define domain and codomain. Can define additional properties, such as continuity, formula, etc.)
-  - Mathematical Concept: Is a description of the properties, categories, relationships, or structure of objects (can be a proposition). Can be used to define what an object is, or what relationships exist between objects.
-    - Examples: Prime number (definition: a positive integer p is called a prime number if and only if the only positive integer divisors of p are 1 and p), "Continuity" (definition: a function f from metric space X to Y is called continuous if and only if...), "Group" (definition: a set G and a binary operation X on set G is called a group (G, X) if and only if (satisfies the definition of a group)...)
-
-### 3. memory_direction (Exploration Direction)
-An exploration direction is a clear direction for exploring conjectures, not necessarily a rigorous mathematical proposition.
-- **id**: Identifier (starting from dir_001)
-- **description**: Detailed description (should be an exploration direction about certain mathematical objects and concepts), not necessarily a rigorous mathematical proposition, but must be a clear direction for exploring conjectures. Must clearly describe the involved mathematical objects and concepts
-- **comment**: Comment (including the motivation for proposing this exploration direction and potential solution paths)
-- **completely_solved**: Boolean (whether this direction has been completely solved/explored)
-
-**Can be**: Exploring the relationship between something and something, finding the value/maximum/minimum of a certain mathematical object, conjecturing the properties of a certain mathematical object, exploring the properties of a certain mathematical object under certain conditions (assuming the object satisfies certain properties or mathematical concepts).
-
-### 4. memory_conjecture (Mathematical Conjecture)
-A mathematical conjecture is a rigorous mathematical proposition (in the form of "prove that"), not a vague exploration direction.
-- **id**: Identifier (starting from conj_001)
-- **statement**: Rigorous mathematical proposition (in the form of "prove that"), cannot be a vague exploration direction. Is a mathematical proposition containing some known mathematical objects and concepts
-- **confidence_score**: Confidence level (High/Medium/Low, based on special case verification or experience)
-- **comment**: Comment (including the motivation for proposing this mathematical conjecture and potential proof method paths)
-- **completely_solved**: Boolean (whether this conjecture has been proven or disproven)
-
-### 5. memory_lemma (Conclusion)
-A conclusion is a proven mathematical proposition, or conditions assumed to hold in the original mathematical text.
-- **id**: Identifier (starting from lem_001)
-- **statement**: Rigorous mathematical proposition (in the form of "prove that"), cannot be a vague exploration direction. Is a mathematical proposition containing some known mathematical objects and concepts
-- **proof**: Complete and rigorous proof (can use known conclusions as lemmas in the proof, but need to note). If it is a condition from the original mathematical text, record as "Conditional assumption"
+''' + _MEMORY_TYPE_DEFS + '''
 
 
 ## Modification Strategy
@@ -284,43 +230,12 @@ Output JSON directly in the following format:
 - Can use lemmas from Memory as lemmas, need to note references'''
 
 
-def get_modify_proof_user_prompt(
-    memory_display: str,
-    conjecture_statement: str,
-    original_proof: str,
-    error_info: str
-) -> str:
-    """
-    Get the user prompt for modifying a proof
-    
-    Input: Memory + conjecture + original proof + error information
-    Output: Complete modified proof (JSON)
-    """
-    return f'''## Current Memory (Project Progress)
-
-{memory_display}
-
----
-
-## Conjecture to Prove
-
-{conjecture_statement}
-
----
-
-## Original Proof (Did Not Pass Verification)
-
-{original_proof}
-
----
-
-## Errors Found by Verifier
-
-{error_info}
+def get_modify_proof_prompt() -> str:
+    """Get the system prompt for modifying proofs"""
+    return _MODIFY_PROOF_SYSTEM_PROMPT
 
----
 
-## Your Task
+_MODIFY_PROOF_USER_TASK = '''## Your Task
 
 Based on the errors found by the verifier, correct the proof.
 
@@ -334,9 +249,28 @@ Based on the errors found by the verifier, correct the proof.
 Please output JSON directly.'''
 
 
-def get_accumulate_attempt_prompt() -> str:
-    """Get the system prompt for accumulating proof attempts"""
-    return '''You are an experienced mathematician participating in a large-scale mathematical exploration project. Your task is to organize and summarize proof attempts, accumulating experience from failures.
+def get_modify_proof_user_prompt(
+    memory_display: str,
+    conjecture_statement: str,
+    original_proof: str,
+    error_info: str
+) -> str:
+    """
+    Get the user prompt for modifying a proof
+    
+    Input: Memory + conjecture + original proof + error information
+    Output: Complete modified proof (JSON)
+    """
+    return "".join((
+        _MEMORY_HEADING, memory_display, _SECTION_BREAK,
+        "## Conjecture to Prove\n\n", conjecture_statement, _SECTION_BREAK,
+        "## Original Proof (Did Not Pass Verification)\n\n", original_proof, _SECTION_BREAK,
+        "## Errors Found by Verifier\n\n", error_info, _SECTION_BREAK,
+        _MODIFY_PROOF_USER_TASK
+    ))
+
+
+_ACCUMULATE_ATTEMPT_SYSTEM_PROMPT = '''You are an experienced mathematician participating in a large-scale mathematical exploration project. Your task is to organize and summarize proof attempts, accumulating experience from failures.
 
 ## Project Background
 
@@ -344,53 +278,7 @@ This is an AI-driven mathematical exploration system. The system maintains a str
 
 ## Memory Data Type Definitions
 
-### 1. memory_object (Mathematical Object)
-A mathematical object is a "noun" in the mathematical world, the subject that is operated on, measured, and studied, possessing a certain "existence" (although abstract). A mathematical object is an **Instance**, which can be defined based on existing mathematical objects.
-- **id**: Identifier (starting from obj_001)
-- **name**: Name (mathematical formula)
-- **type_and_definition**: Type & Definition (complete and clear mathematical definition, can depend on existing mathematical objects and concepts)
-- **comment**: Comment (including the motivation for defining this object and potential exploration directions)
-
-**Examples**: $n$ (type is integer), $n^2$ (type is integer, depends on existing object $n$), $A$ (type is matrix), $f$ (type is function, need to clearly define domain and codomain, can define additional properties like continuity, formula, etc.)
-
-### 2. memory_concept (Mathematical Concept)
-A mathematical concept is a description of the properties, categories, relationships, or structure of objects (can be a proposition). It is used to define what an object is, or what relationships exist between objects. A mathematical concept determines whether a mathematical object satisfies a certain proposition.
-- **id**: Identifier (starting from con_001)
-- **name**: Name (a name that highlights the nature and content of this concept. If it is a consensus concept in the mathematical field, use the standard definition and name.)
-- **definition**: Definition (complete and clear mathematical definition, can depend on existing mathematical concepts. If it is a consensus concept in the mathematical field, use the standard definition and name.)
-- **comment**: Comment (including the motivation for defining this concept and potential exploration directions)
-
-**Examples**: Prime number (definition: a positive integer p is called a prime number if and only if the only positive integer divisors of p are 1 and p), Continuity (has different definitions in different spaces, but must be strictly defined before being introduced into Memory in this project), Group (definition...)
-
-**Note**: Both mathematical objects and mathematical concepts can be defined based on existing objects or concepts.
-**Note**: Distinction between mathematical objects and mathematical concepts (Concept is a type/proposition. Object is an Instance)
-  - Mathematical Object: Is a "noun" in the mathematical world, they are the subjects that are operated on, measured, and studied, they often possess a certain "existence" (although abstract). Mathematical objects can be defined based on existing mathematical objects.
-    - Examples: n (type is integer), n^2 (type is integer, depends on existing object $n$), A (type is matrix), f (type is function, need to clearly define domain and codomain. Can define additional properties, such as continuity, formula, etc.)
-  - Mathematical Concept: Is a description of the properties, categories, relationships, or structure of objects (can be a proposition). Can be used to define what an object is, or what relationships exist between objects.
-    - Examples: Prime number (definition: a positive integer p is called a prime number if and only if the only positive integer divisors of p are 1 and p), "Continuity" (definition: a function f from metric space X to Y is called continuous if and only if...), "Group" (definition: a set G and a binary operation X on set G is called a group (G, X) if and only if (satisfies the definition of a group)...)
-
-### 3. memory_direction (Exploration Direction)
-An exploration direction is a clear direction for exploring conjectures, not necessarily a rigorous mathematical proposition.
-- **id**: Identifier (starting from dir_001)
-- **description**: Detailed description (should be an exploration direction about certain mathematical objects and concepts), not necessarily a rigorous mathematical proposition, but must be a clear direction for exploring conjectures. Must clearly describe the involved mathematical objects and concepts
-- **comment**: Comment (including the motivation for proposing this exploration direction and potential solution paths)
-- **completely_solved**: Boolean (whether this direction has been completely solved/explored)
-
-**Can be**: Exploring the relationship between something and something, finding the value/maximum/minimum of a certain mathematical object, conjecturing the properties of a certain mathematical object, exploring the properties of a certain mathematical object under certain conditions (assuming the object satisfies certain properties or mathematical concepts).
-
-### 4. memory_conjecture (Mathematical Conjecture)
-A mathematical conjecture is a rigorous mathematical proposition (in the form of "prove that"), not a vague exploration direction.
-- **id**: Identifier (starting from conj_001)
-- **statement**: Rigorous mathematical proposition (in the form of "prove that"), cannot be a vague exploration direction. Is a mathematical proposition containing some known mathematical objects and concepts
-- **confidence_score**: Confidence level (High/Medium/Low, based on special case verification or experience)
-- **comment**: Comment (including the motivation for proposing this mathematical conjecture and potential proof method paths)
-- **completely_solved**: Boolean (whether this conjecture has been proven or disproven)
-
-### 5. memory_lemma (Conclusion)
-A conclusion is a proven mathematical proposition, or conditions assumed to hold in the original mathematical text.
-- **id**: Identifier (starting from lem_001)
-- **statement**: Rigorous mathematical proposition (in the form of "prove that"), cannot be a vague exploration direction. Is a mathematical proposition containing some known mathematical objects and concepts
-- **proof**: Complete and rigorous proof (can use known conclusions as lemmas in the proof, but need to note). If it is a condition from the original mathematical text, record as "Conditional assumption"
+''' + _MEMORY_TYPE_DEFS + '''
 
 ## Your Task
 
@@ -431,6 +319,25 @@ Output JSON directly in the following format:
 - Language should be concise and clear, easy for subsequent workers to quickly understand the situation'''
 
 
+def get_accumulate_attempt_prompt() -> str:
+    """Get the system prompt for accumulating proof attempts"""
+    return _ACCUMULATE_ATTEMPT_SYSTEM_PROMPT
+
+
+_ACCUMULATE_ATTEMPT_USER_TASK = '''## Your Task
+
+Organize these proof attempts, accumulate experience from failures:
+
+1. **Summarize each attempt**: Method, progress, and obstacles
+2. **Extract key insights**: What was learned from failures
+3. **Suggest new directions**: Based on existing attempts, propose new possible approaches
+4. **Update conjecture comment**: Integrate original comment and new experience
+
+**Goal**: Enable subsequent workers to learn from these attempts, avoid repeating the same mistakes, and gain new inspiration.
+
+Please output JSON directly.'''
+
+
 def get_accumulate_attempt_user_prompt(
     memory_display: str,
     conjecture_id: str,
@@ -445,41 +352,12 @@ def get_accumulate_attempt_user_prompt(
     Input: Memory + conjecture + proof attempts + error information
     Output: Organized proof paths and updated conjecture comment (JSON)
     """
-    return f'''## Current Memory (Project Progress)
-
-{memory_display}
-
----
-
-## Conjecture [{conjecture_id}]
-
-**Statement**: {conjecture_statement}
-
-**Original Comment**: {original_comment if original_comment else "(None)"}
-
----
-
-## Proof Attempt Records
-
-{proof_attempts}
-
----
-
-## Error Information for Each Attempt
-
-{error_infos}
-
----
-
-## Your Task
-
-Organize these proof attempts, accumulate experience from failures:
-
-1. **Summarize each attempt**: Method, progress, and obstacles
-2. **Extract key insights**: What was learned from failures
-3. **Suggest new directions**: Based on existing attempts, propose new possible approaches
-4. **Update conjecture comment**: Integrate original comment and new experience
-
-**Goal**: Enable subsequent workers to learn from these attempts, avoid repeating the same mistakes, and gain new inspiration.
-
-Please output JSON directly.'''
+    return "".join((
+        _MEMORY_HEADING, memory_display, _SECTION_BREAK,
+        "## Conjecture [", conjecture_id, "]\n\n",
+        "**Statement**: ", conjecture_statement, "\n\n",
+        "**Original Comment**: ", original_comment if original_comment else "(None)", _SECTION_BREAK,
+        "## Proof Attempt Records\n\n", proof_attempts, _SECTION_BREAK,
+        "## Error Information for Each Attempt\n\n", error_infos, _SECTION_BREAK,
+        _ACCUMULATE_ATTEMPT_USER_TASK
+    ))
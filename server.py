@@ -4,17 +4,19 @@ Flask server providing REST API and SSE for interactive exploration
 """
 
 import asyncio
+import concurrent.futures
 import json
-import queue
+import os
 import threading
+import time
 import logging
+import mimetypes
 import traceback
-from datetime import datetime
-from flask import Flask, request, jsonify, Response, send_from_directory
+import uuid
+from collections import deque
+from flask import Flask, request, Response, abort, send_from_directory
 from flask_cors import CORS
-
-from agent import MathExplorerAgent
-from config import MEMORY_SAVE_PATH
+from werkzeug.utils import safe_join
 
 # Configure logging for production debugging
 logging.basicConfig(
@@ -23,88 +25,295 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Response compression, br/gzip for JSON and website files (requires: pip install flask-compress)
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None  # flask-compress not installed, responses are sent uncompressed
+
+# orjson serializes events and responses much faster than json (requires: pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None  # orjson not installed, fall back to json
+
+
+def _dump(obj) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_response(obj, status: int = 200) -> Response:
+    """Build a JSON response serialized with _dump"""
+    return Response(_dump(obj), status=status, mimetype='application/json')
+
+
 app = Flask(__name__, static_folder='website', static_url_path='/website')
 CORS(app)
+# Let the front proxy send static files (X-Sendfile, Apache mod_xsendfile or lighttpd), only enable when the proxy supports it
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', 'false').lower() == 'true'
+# Buffered responses (API JSON) use COMPRESS_ALGORITHM. flask-compress treats send_from_directory
+# responses (website files) as streamed and picks from COMPRESS_ALGORITHM_STREAMING, which has no gzip,
+# so gzip-only clients get those uncompressed.
+# text/event-stream is left out on purpose, a compressed SSE stream would be buffered instead of flushed per event
+_COMPRESS_ALGORITHMS = ['br', 'gzip']
+app.config.update(
+    COMPRESS_ALGORITHM=_COMPRESS_ALGORITHMS,
+    COMPRESS_ALGORITHM_STREAMING=['br', 'deflate'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_DEFLATE_LEVEL=4,
+    COMPRESS_MIN_SIZE=1024,
+    COMPRESS_MIMETYPES=['application/json', 'text/html', 'text/css', 'text/javascript', 'application/javascript'],
+    COMPRESS_REGISTER=False,  # compress_response below decides which responses get compressed
+)
+_compress = Compress(app) if Compress is not None else None
+# Header-only responses the front proxy fills in with the file as is, compressing them would label it br/gzip
+_PROXY_FILE_HEADERS = ('X-Accel-Redirect', 'X-Sendfile')
+
+
+@app.after_request
+def compress_response(response):
+    """Compress the response, except for X-Accel-Redirect / X-Sendfile responses"""
+    if _compress is None or any(header in response.headers for header in _PROXY_FILE_HEADERS):
+        return response
+    return _compress.after_request(response)
 
 # Global state
 agent_instance = None
-event_queue = queue.Queue()
+_agent_handlers = []  # (event, handler) pairs registered on agent_instance
 is_running = False
 current_round = 0
+_run_future = None  # Future of the exploration job on the background loop, one job at a time
+_initializing = False  # /api/start is building and initializing a new agent
+_state_lock = threading.Lock()  # Guards the check-and-set of the state above in /api/start and /api/run
+
+# Background event loop shared by all requests, so async resources (locks, clients) live across them
+_loop = None
+_loop_lock = threading.Lock()
+
+# Agent stack (LLM client, config, prompts), imported on first use
+_agent_class = None
+_agent_import_lock = threading.Lock()
+
+# SSE event bus: one pending-event deque per connected stream, guarded by a condition the streams wait on.
+# Events are (id, encoded SSE frame) pairs; the last SSE_HISTORY_SIZE are kept so reconnecting clients
+# (Last-Event-ID header) receive what they missed
+SSE_QUEUE_SIZE = 1024        # Pending events per stream, a slow client loses the oldest ones
+SSE_HISTORY_SIZE = 1024      # Past events kept for reconnecting clients
+SSE_KEEPALIVE_INTERVAL = 30  # Seconds of silence before the stream sends a keepalive
+_subscribers = []
+_subscribers_cv = threading.Condition()
+_history = deque(maxlen=SSE_HISTORY_SIZE)
+_last_event_id = 0
+# SSE ids are "<process nonce>-<n>", ids from before a restart (or from another worker) are recognised as foreign
+_EVENT_ID_NONCE = uuid.uuid4().hex[:8]
+_drop_warned = False  # Dropping is logged once per process
+_KEEPALIVE_FRAME = b"data: " + _dump({'type': 'keepalive'}) + b"\n\n"
+
+# Coalesced action events waiting for the flush timer, guarded by _coalesce_lock (taken before _subscribers_cv)
+SSE_COALESCE_INTERVAL = 0.05  # Seconds action_start/action_complete events are held to be batched
+_coalesced = []
+_coalesce_lock = threading.Lock()
+_coalesce_timer = None
+
+# (Memory version key, encoded Memory JSON) of the last /api/memory response
+_memory_json_cache = None
+
+
+def _stamp(event):
+    """Stamp event['data'] with the current time (epoch milliseconds, new Date(ts) in JS)"""
+    if 'data' in event:
+        event['data']['timestamp'] = time.time_ns() // 1_000_000
+
+
+def _publish(event):
+    """Number an event and append its SSE frame to the history and every connected SSE stream"""
+    global _last_event_id, _drop_warned
+    payload = _dump(event)  # Encoded once, every stream sends the same bytes
+    with _subscribers_cv:
+        _last_event_id += 1
+        item = (_last_event_id, b"id: %s-%d\ndata: %b\n\n" % (_EVENT_ID_NONCE.encode(), _last_event_id, payload))
+        _history.append(item)
+        for events in _subscribers:
+            if len(events) == SSE_QUEUE_SIZE and not _drop_warned:
+                # The deque is full, appending drops the oldest pending event
+                _drop_warned = True
+                logger.warning(f"[broadcast] SSE client is {SSE_QUEUE_SIZE} events behind, dropping its oldest events")
+            events.append(item)
+        _subscribers_cv.notify_all()
+
+
+def broadcast(event):
+    """Push an event to every connected SSE stream now, after any pending coalesced events"""
+    _stamp(event)
+    with _coalesce_lock:
+        _flush_coalesced_locked()
+        _publish(event)
+
+
+def broadcast_coalesced(event):
+    """
+    Push a high-frequency event, events within SSE_COALESCE_INTERVAL are sent together
+    as one action_batch event ({'type': 'action_batch', 'data': {'events': [...]}})
+    """
+    global _coalesce_timer
+    _stamp(event)
+    with _coalesce_lock:
+        _coalesced.append(event)
+        if _coalesce_timer is None:
+            _coalesce_timer = threading.Timer(SSE_COALESCE_INTERVAL, _flush_coalesced)
+            _coalesce_timer.daemon = True
+            _coalesce_timer.start()
+
+
+def _flush_coalesced():
+    with _coalesce_lock:
+        _flush_coalesced_locked()
+
+
+def _flush_coalesced_locked():
+    """Publish the pending coalesced events (caller holds _coalesce_lock, keeping event order)"""
+    global _coalesce_timer
+    if _coalesce_timer is not None:
+        _coalesce_timer.cancel()
+        _coalesce_timer = None
+    if not _coalesced:
+        return
+    
+    if len(_coalesced) == 1:
+        _publish(_coalesced[0])
+    else:
+        batch = {'type': 'action_batch', 'data': {'events': list(_coalesced)}}
+        _stamp(batch)
+        _publish(batch)
+    _coalesced.clear()
+
+
+def _memory_json(memory_manager) -> bytes:
+    """Encoded Memory JSON, re-encoded only when the Memory changes (polling hits the cache)"""
+    global _memory_json_cache
+    version_key = memory_manager.get_version_key()
+    cache = _memory_json_cache
+    if cache is None or cache[0] != version_key:
+        cache = (version_key, _dump(memory_manager.get_memory_dict()))
+        _memory_json_cache = cache
+    return cache[1]
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """Get the long-lived event loop that runs all agent coroutines, started on first use"""
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='agent-event-loop', daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def run_coroutine(coro) -> concurrent.futures.Future:
+    """Schedule a coroutine on the background event loop (thread-safe)"""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def _run_in_progress() -> bool:
+    """Whether an agent is initializing or its job is still on the loop (is_running is cleared early by /api/stop)"""
+    return _initializing or is_running or (_run_future is not None and not _run_future.done())
+
+
+def get_agent_class():
+    """Import the agent stack once, on first use, so the server answers /health right after binding"""
+    global _agent_class
+    if _agent_class is None:
+        with _agent_import_lock:
+            if _agent_class is None:
+                from agent import MathExplorerAgent
+                _agent_class = MathExplorerAgent
+    return _agent_class
+
 
 # ================================
 # Event Handlers
 # ================================
 def setup_event_handlers(agent):
-    """Setup event handlers to push updates to SSE queue"""
+    """Setup event handlers to push updates to the SSE stream, returns the (event, handler) pairs"""
     
     def on_action_start(data):
-        event_queue.put({
+        broadcast_coalesced({
             'type': 'action_start',
             'data': {
                 'action_id': data.get('action_id', ''),
-                'action_type': data.get('action_type', ''),
-                'timestamp': datetime.now().isoformat()
+                'action_type': data.get('action_type', '')
             }
         })
     
     def on_action_complete(data):
-        event_queue.put({
+        broadcast_coalesced({
             'type': 'action_complete',
             'data': {
                 'action_id': data.get('action_id', ''),
                 'action_type': data.get('action_type', ''),
-                'status': data.get('status', 'completed'),
-                'timestamp': datetime.now().isoformat()
+                'status': data.get('status', 'completed')
             }
         })
     
     def on_action_error(data):
-        event_queue.put({
+        broadcast({
             'type': 'action_error',
             'data': {
                 'action_id': data.get('action_id', ''),
-                'error': data.get('error', 'Unknown error'),
-                'timestamp': datetime.now().isoformat()
+                'error': data.get('error', 'Unknown error')
             }
         })
     
     def on_round_start(data):
         global current_round
         current_round = data.get('round', 0)
-        event_queue.put({
+        broadcast({
             'type': 'round_start',
             'data': {
                 'round': current_round,
-                'actions_count': data.get('actions_count', 0),
-                'timestamp': datetime.now().isoformat()
+                'actions_count': data.get('actions_count', 0)
             }
         })
     
     def on_round_complete(data):
-        event_queue.put({
+        broadcast({
             'type': 'round_complete',
             'data': {
-                'round': data.get('round', 0),
-                'timestamp': datetime.now().isoformat()
+                'round': data.get('round', 0)
             }
         })
     
     def on_memory_saved(path):
-        event_queue.put({
+        broadcast({
             'type': 'memory_saved',
             'data': {
-                'path': path,
-                'timestamp': datetime.now().isoformat()
+                'path': path
             }
         })
     
-    agent.on('action_start', on_action_start)
-    agent.on('action_complete', on_action_complete)
-    agent.on('action_error', on_action_error)
-    agent.on('round_start', on_round_start)
-    agent.on('round_complete', on_round_complete)
-    agent.on('memory_saved', on_memory_saved)
+    handlers = [
+        ('action_start', on_action_start),
+        ('action_complete', on_action_complete),
+        ('action_error', on_action_error),
+        ('round_start', on_round_start),
+        ('round_complete', on_round_complete),
+        ('memory_saved', on_memory_saved)
+    ]
+    for event, handler in handlers:
+        agent.on(event, handler)
+    return handlers
+
+
+def teardown_event_handlers(agent, handlers):
+    """Remove the handlers added by setup_event_handlers, a replaced agent stops pushing to the SSE stream"""
+    for event, handler in handlers:
+        agent.off(event, handler)
 
 
 # ================================
@@ -130,15 +339,49 @@ def serve_js():
     """Serve app.js from root"""
     return send_from_directory('website', 'app.js')
 
+# Internal nginx location aliased to memory_snapshots/ (e.g. /_internal_snapshots/), when set
+# snapshot downloads are handed to nginx with X-Accel-Redirect instead of streamed by a worker thread
+SNAPSHOT_ACCEL_PREFIX = os.getenv('SNAPSHOT_ACCEL_PREFIX', '')
+
 @app.route('/memory_snapshots/<path:filename>')
 def serve_memory(filename):
     """Serve memory snapshot files"""
-    return send_from_directory('memory_snapshots', filename)
+    if not SNAPSHOT_ACCEL_PREFIX:
+        return send_from_directory('memory_snapshots', filename)
+    
+    path = safe_join('memory_snapshots', filename)
+    if path is None or not os.path.isfile(path):
+        abort(404)
+    response = Response(mimetype=mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+    response.headers['X-Accel-Redirect'] = SNAPSHOT_ACCEL_PREFIX.rstrip('/') + '/' + filename
+    return response
+
+
+# Website files keep stable names, so browsers revalidate them (ETag) on every load;
+# content-hashed files under /website/assets/ never change and are cached for a year
+_WEBSITE_ENDPOINTS = {'static', 'index', 'website_index', 'serve_css', 'serve_js'}
+_IMMUTABLE_ASSET_PREFIX = '/website/assets/'
+
+@app.after_request
+def set_cache_headers(response):
+    """Set Cache-Control for website files"""
+    if request.endpoint in _WEBSITE_ENDPOINTS:
+        if request.path.startswith(_IMMUTABLE_ASSET_PREFIX):
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 # ================================
 # API Endpoints
 # ================================
+@app.route('/health', methods=['GET'])
+def health():
+    """Liveness check, does not load the agent"""
+    return _json_response({'status': 'ok'})
+
+
 @app.route('/api/status', methods=['GET'])
 def get_status():
     """Get current agent status"""
@@ -148,16 +391,9 @@ def get_status():
     memory_summary = None
     
     if has_agent:
-        memory = agent_instance.memory_manager.get_memory()
-        memory_summary = {
-            'objects': len(memory.objects),
-            'concepts': len(memory.concepts),
-            'directions': len(memory.directions),
-            'conjectures': len(memory.conjectures),
-            'lemmas': len(memory.lemmas)
-        }
+        memory_summary = agent_instance.memory_manager.get_memory_counts()
     
-    return jsonify({
+    return _json_response({
         'initialized': has_agent,
         'running': is_running,
         'current_round': current_round,
@@ -168,136 +404,139 @@ def get_status():
 @app.route('/api/start', methods=['POST'])
 def start_exploration():
     """Initialize exploration from math text input"""
-    global agent_instance, is_running
-    
-    if is_running:
-        return jsonify({'error': 'Exploration is already running'}), 400
+    global _initializing
     
     data = request.get_json()
     math_text = data.get('text', '')
     
     if not math_text.strip():
-        return jsonify({'error': 'Math text is required'}), 400
+        return _json_response({'error': 'Math text is required'}, 400)
+    
+    # Claim the agent slot, other /api/start and /api/run calls fail fast until initialization ends
+    with _state_lock:
+        if _run_in_progress():
+            return _json_response({'error': 'Exploration is already running'}, 400)
+        _initializing = True
     
     try:
-        # Create new agent instance
-        agent_instance = MathExplorerAgent(save_path=MEMORY_SAVE_PATH)
-        setup_event_handlers(agent_instance)
+        return _start_agent(math_text)
+    finally:
+        _initializing = False
+
+
+def _start_agent(math_text: str):
+    """Replace the agent and parse the input text (caller has set _initializing)"""
+    global agent_instance, _agent_handlers
+    
+    try:
+        # Create new agent instance, detaching the previous one from the SSE stream
+        from config import MEMORY_SAVE_PATH
+        if agent_instance is not None:
+            teardown_event_handlers(agent_instance, _agent_handlers)
+        agent_instance = get_agent_class()(save_path=MEMORY_SAVE_PATH)
+        _agent_handlers = setup_event_handlers(agent_instance)
         
         # Initialize from input (runs Action 1: Parse Input)
-        # Note: initialize_from_input is async, so we need to run it in an event loop
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(agent_instance.initialize_from_input(math_text))
-        loop.close()
+        # Note: initialize_from_input is async, run it on the background event loop and wait
+        result = run_coroutine(agent_instance.initialize_from_input(math_text)).result()
         
         # Get initial memory state
-        memory = agent_instance.memory_manager.get_memory()
+        memory_dict = agent_instance.memory_manager.get_memory_dict()
         
-        event_queue.put({
+        broadcast({
             'type': 'initialized',
             'data': {
                 'success': True,
-                'memory': memory.to_dict(),
-                'timestamp': datetime.now().isoformat()
+                'memory': memory_dict
             }
         })
         
-        return jsonify({
+        return _json_response({
             'success': True,
             'message': 'Exploration initialized',
-            'memory': memory.to_dict()
+            'memory': memory_dict
         })
         
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return _json_response({'error': str(e)}, 500)
 
 
 @app.route('/api/run', methods=['POST'])
 def run_exploration():
     """Run exploration rounds"""
-    global agent_instance, is_running
-    
-    if agent_instance is None:
-        return jsonify({'error': 'Agent not initialized. Call /api/start first.'}), 400
-    
-    if is_running:
-        return jsonify({'error': 'Exploration is already running'}), 400
+    global _run_future
     
     data = request.get_json() or {}
     rounds = data.get('rounds', 1)
     
+    with _state_lock:
+        if agent_instance is None:
+            return _json_response({'error': 'Agent not initialized. Call /api/start first.'}, 400)
+        
+        if _run_in_progress():
+            return _json_response({'error': 'Exploration is already running'}, 400)
+        
+        _run_future = _schedule_rounds(rounds)
+    
+    return _json_response({
+        'success': True,
+        'message': f'Started {rounds} exploration round(s)'
+    })
+
+
+def _schedule_rounds(rounds: int) -> concurrent.futures.Future:
+    """Mark the agent running and schedule its rounds on the background loop (caller holds _state_lock)"""
+    global is_running
+    
     # Mark as running immediately to prevent race conditions
     is_running = True
     logger.info(f"[run_exploration] Starting {rounds} rounds, is_running set to True")
     
-    def run_async():
+    async def run_rounds():
         global is_running
-        logger.info(f"[run_async] Thread entry point reached")
-        
-        loop = None
         try:
-            # Create and set new event loop for this thread
-            logger.info("[run_async] Creating new event loop for thread...")
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            logger.info("[run_async] Event loop created and set")
-            
             # Log agent state
-            logger.info(f"[run_async] Agent instance: {agent_instance is not None}")
+            logger.info(f"[run_rounds] Agent instance: {agent_instance is not None}")
             if agent_instance:
-                logger.info(f"[run_async] Memory summary: {agent_instance.get_memory_summary()}")
+                logger.info(f"[run_rounds] Memory summary: {agent_instance.get_memory_summary()}")
             
             # Run the agent
-            logger.info("[run_async] Calling agent.run()...")
-            result = loop.run_until_complete(
-                agent_instance.run(max_rounds=rounds, rounds_per_checkpoint=rounds + 1)
-            )
-            logger.info(f"[run_async] agent.run() completed successfully")
+            logger.info("[run_rounds] Calling agent.run()...")
+            result = await agent_instance.run(max_rounds=rounds, rounds_per_checkpoint=rounds + 1)
+            logger.info(f"[run_rounds] agent.run() completed successfully")
             
-            event_queue.put({
+            broadcast({
                 'type': 'exploration_complete',
                 'data': {
                     'success': True,
-                    'rounds_completed': rounds,
-                    'timestamp': datetime.now().isoformat()
+                    'rounds_completed': rounds
                 }
             })
             
         except Exception as e:
-            logger.error(f"[run_async] Exception caught: {type(e).__name__}: {e}")
-            logger.error(f"[run_async] Full traceback:\n{traceback.format_exc()}")
+            logger.error(f"[run_rounds] Exception caught: {type(e).__name__}: {e}")
+            logger.error(f"[run_rounds] Full traceback:\n{traceback.format_exc()}")
             
-            event_queue.put({
+            broadcast({
                 'type': 'exploration_error',
                 'data': {
                     'error': str(e),
-                    'error_type': type(e).__name__,
-                    'timestamp': datetime.now().isoformat()
+                    'error_type': type(e).__name__
                 }
             })
             
         finally:
-            if loop:
-                try:
-                    loop.close()
-                    logger.info("[run_async] Event loop closed")
-                except Exception as e:
-                    logger.error(f"[run_async] Error closing loop: {e}")
-            
             is_running = False
-            logger.info("[run_async] Thread finished, is_running set to False")
-    
-    # Run in background thread (daemon=True so it doesn't block shutdown)
-    thread = threading.Thread(target=run_async, daemon=True)
-    logger.info("[run_exploration] Starting background thread...")
-    thread.start()
-    logger.info(f"[run_exploration] Thread started: {thread.name}, alive: {thread.is_alive()}")
+            logger.info("[run_rounds] Finished, is_running set to False")
     
-    return jsonify({
-        'success': True,
-        'message': f'Started {rounds} exploration round(s)'
-    })
+    # Schedule on the background event loop and return immediately, the future keeps further
+    # runs out until this one has really finished (not just been asked to stop).
+    # The loop runs callbacks in order: the stale stop is cleared before the run starts, and a stop
+    # sent right after this request lands after both, so it stops the run even before its first step
+    get_event_loop().call_soon_threadsafe(agent_instance.clear_stop_request)
+    future = run_coroutine(run_rounds())
+    logger.info("[run_exploration] Exploration scheduled on the background event loop")
+    return future
 
 
 @app.route('/api/memory', methods=['GET'])
@@ -306,38 +545,86 @@ def get_memory():
     global agent_instance
     
     if agent_instance is None:
-        return jsonify({'error': 'Agent not initialized'}), 400
+        return _json_response({'error': 'Agent not initialized'}, 400)
     
-    memory = agent_instance.memory_manager.get_memory()
-    return jsonify(memory.to_dict())
+    # The Memory version key is a weak ETag, polling clients revalidate and get 304 while nothing changed
+    memory_manager = agent_instance.memory_manager
+    version_key = memory_manager.get_version_key()
+    # flask-compress tags compressed responses as W/"<key>:<algorithm>", accept those too
+    if any(request.if_none_match.contains_weak(tag)
+           for tag in [version_key] + [f"{version_key}:{algorithm}" for algorithm in _COMPRESS_ALGORITHMS]):
+        response = Response(status=304)
+    else:
+        response = Response(_memory_json(memory_manager), mimetype='application/json')
+    response.set_etag(version_key, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
 
 
 @app.route('/api/stop', methods=['POST'])
 def stop_exploration():
-    """Stop current exploration (sets flag for next checkpoint)"""
+    """Stop current exploration (running actions are cancelled)"""
     global is_running
     
-    # Note: This doesn't immediately stop, but will stop at next checkpoint
     is_running = False
+    # The stop event lives on the background loop, set it from the loop's own thread
+    if agent_instance is not None:
+        get_event_loop().call_soon_threadsafe(agent_instance.request_stop)
     
-    return jsonify({
+    return _json_response({
         'success': True,
-        'message': 'Stop requested (will stop at next checkpoint)'
+        'message': 'Stop requested'
+    })
+
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Get verification cache statistics"""
+    from verify_cache import get_verify_cache
+    return _json_response({
+        'verify_cache': get_verify_cache().get_stats()
     })
 
 
 @app.route('/api/stream')
 def event_stream():
-    """SSE endpoint for real-time updates"""
+    """SSE endpoint for real-time updates (resumes after the Last-Event-ID a reconnecting client sends)"""
+    # EventSource sends the header when it reconnects by itself, a new EventSource can only pass a parameter
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id', '')
+    if not last_event_id:
+        resume_after = None  # New client
+    else:
+        nonce, _, number = last_event_id.partition('-')
+        # An id from another process is from before a server restart, everything kept is new to the client
+        resume_after = int(number) if nonce == _EVENT_ID_NONCE and number.isdigit() else 0
+    
     def generate():
-        while True:
-            try:
-                # Wait for event with timeout
-                event = event_queue.get(timeout=30)
-                yield f"data: {json.dumps(event)}\n\n"
-            except queue.Empty:
-                # Send keepalive
-                yield f"data: {json.dumps({'type': 'keepalive'})}\n\n"
+        events = deque(maxlen=SSE_QUEUE_SIZE)
+        with _subscribers_cv:
+            if resume_after is not None:
+                events.extend(item for item in _history if item[0] > resume_after)
+            _subscribers.append(events)
+        
+        try:
+            keepalive_at = time.monotonic() + SSE_KEEPALIVE_INTERVAL
+            while True:
+                # Wait for an event until the keepalive is due, wakeups without an event wait again
+                with _subscribers_cv:
+                    _subscribers_cv.wait_for(lambda: events, timeout=max(0.0, keepalive_at - time.monotonic()))
+                    frames = [frame for _, frame in events]
+                    events.clear()
+                
+                if not frames:
+                    # Send keepalive
+                    yield _KEEPALIVE_FRAME
+                else:
+                    # Everything pending goes out in one write
+                    yield b"".join(frames)
+                keepalive_at = time.monotonic() + SSE_KEEPALIVE_INTERVAL
+        finally:
+            # Client disconnected
+            with _subscribers_cv:
+                _subscribers.remove(events)
     
     return Response(
         generate(),
@@ -354,7 +641,6 @@ def event_stream():
 # Main
 # ================================
 if __name__ == '__main__':
-    import os
     port = int(os.getenv('PORT', 5000))
     debug = os.getenv('DEBUG', 'true').lower() == 'true'
     
@@ -0,0 +1,96 @@
+"""
+Verification Cache Module
+Process-wide LRU cache of segment verdicts, so segments that survive a proof modification
+round unchanged, together with all the lines before them, are not sent to the verifier again
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import Any, Dict, Optional
+
+from config import VERIFY_CACHE_SIZE
+
+
+def make_verify_key(conjecture_statement: str, proof_prefix_digest: bytes, segment: str, memory_key: str) -> bytes:
+    """
+    Build the cache key of a segment verdict
+
+    Args:
+        conjecture_statement: Conjecture proposition
+        proof_prefix_digest: Digest of the proof up to the segment's last line (the steps it may rely on)
+        segment: Segment content
+        memory_key: Identifies the Memory state the segment was verified against
+            (MemoryManager.get_version_key)
+    """
+    digest = blake2b(digest_size=16)
+    digest.update(conjecture_statement.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(proof_prefix_digest)
+    digest.update(segment.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(memory_key.encode("utf-8"))
+    return digest.digest()
+
+
+class VerifyCache:
+    """Thread-safe LRU cache of verdicts (stored as JSON, every hit returns a fresh copy)"""
+
+    def __init__(self, maxsize: int = VERIFY_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Get a cached verdict, None on miss"""
+        with self._lock:
+            verdict_json = self._entries.get(key)
+            if verdict_json is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return json.loads(verdict_json)
+
+    def put(self, key: bytes, verdict: Dict[str, Any]):
+        """Cache a verdict, evicting the least recently used one when full"""
+        verdict_json = json.dumps(verdict, ensure_ascii=False)
+        with self._lock:
+            self._entries[key] = verdict_json
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached verdicts and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+
+# Global cache instance
+_cache: Optional[VerifyCache] = None
+
+
+def get_verify_cache() -> VerifyCache:
+    """Get global verification cache"""
+    global _cache
+    if _cache is None:
+        _cache = VerifyCache()
+    return _cache
@@ -16,6 +16,7 @@ let currentTab = 'objects';
 let isExplorationActive = false;
 let isRunning = false;
 let eventSource = null;
+let lastEventId = null;
 
 // ================================
 // DOM Elements
@@ -258,9 +259,14 @@ function connectSSE() {
         eventSource.close();
     }
 
-    eventSource = new EventSource(`${API_BASE}/api/stream`);
+    // A new EventSource does not send Last-Event-ID, so pass it in the URL to resume
+    const resume = lastEventId !== null ? `?last_event_id=${encodeURIComponent(lastEventId)}` : '';
+    eventSource = new EventSource(`${API_BASE}/api/stream${resume}`);
 
     eventSource.onmessage = (event) => {
+        if (event.lastEventId) {
+            lastEventId = event.lastEventId;
+        }
         try {
             const data = JSON.parse(event.data);
             handleSSEEvent(data);
@@ -278,6 +284,11 @@ function connectSSE() {
 
 function handleSSEEvent(event) {
     switch (event.type) {
+        case 'action_batch':
+            // Action events sent together by the server
+            event.data.events.forEach(handleSSEEvent);
+            break;
+
         case 'action_start':
             addLogEntry(`▶ ${event.data.action_type} started`, 'action-start');
             break;